@@ -5,6 +5,8 @@ Global pytest configuration for the project.
 import sys
 from pathlib import Path
 
-# Add project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+# Add project root to Python path (idempotent - avoids duplicate entries
+# that would slow down every subsequent import's sys.path scan)
+project_root = str(Path(__file__).parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
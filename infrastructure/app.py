@@ -31,8 +31,12 @@ def get_aws_account_and_region():
         return None, None
 
 
-def parse_arguments():
-    """명령어 인자 파싱"""
+# 모듈 수준 파서 캐시 (최초 parse_arguments 호출 시 한 번만 생성)
+_PARSER = None
+
+
+def _build_parser():
+    """명령어 인자 파서 생성"""
     parser = argparse.ArgumentParser(description="Deploy Weather API CDK Stack")
     parser.add_argument(
         "--env",
@@ -41,8 +45,15 @@ def parse_arguments():
     )
     parser.add_argument("--account", help="AWS Account ID (overrides auto-detection)")
     parser.add_argument("--region", help="AWS Region (overrides auto-detection)")
+    return parser
 
-    return parser.parse_args()
+
+def parse_arguments():
+    """명령어 인자 파싱"""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER.parse_args()
 
 
 def main():
@@ -2,10 +2,13 @@
 DynamoDB cache service for weather data with retry logic.
 """
 
+import asyncio
 import logging
 import os
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from decimal import Decimal
 
 import boto3
@@ -13,10 +16,22 @@ from botocore.exceptions import ClientError, NoCredentialsError
 
 from models import WeatherResponse
 from config import RetryConfig
-from retry_service import RetryConfig as RetryConfigClass, dynamodb_retry
+from retry_service import (
+    RetryConfig as RetryConfigClass,
+    calculate_delay,
+    dynamodb_retry,
+)
 
 logger = logging.getLogger(__name__)
 
+# DynamoDB hard limits per batch API call
+BATCH_GET_MAX_KEYS = 100
+BATCH_WRITE_MAX_ITEMS = 25
+
+# In-memory (L1) cache tier limits per warm Lambda container
+L1_MAX_ENTRIES = 1024
+L1_TTL_SECONDS = 30.0
+
 
 class CacheError(Exception):
     """Base exception for cache-related errors."""
@@ -47,6 +62,13 @@ class DynamoDBCacheService:
         self.ttl_minutes = ttl_minutes
         self.region = region
 
+        # L1 in-memory cache tier: cache_key -> (weather, expiry monotonic time).
+        # Survives across invocations of the same warm Lambda container and
+        # avoids a DynamoDB round-trip for recently fetched cities.
+        self._l1_cache: OrderedDict[str, Tuple[WeatherResponse, float]] = OrderedDict()
+        self._l1_max_entries = L1_MAX_ENTRIES
+        self._l1_ttl_seconds = L1_TTL_SECONDS
+
         # Initialize retry configuration
         self.retry_config = RetryConfigClass(
             max_attempts=RetryConfig.DYNAMODB_MAX_ATTEMPTS,
@@ -116,6 +138,49 @@ class DynamoDBCacheService:
 
         return current_time < expires_at
 
+    def _l1_get(self, cache_key: str) -> Optional[WeatherResponse]:
+        """
+        Get weather data from the in-memory L1 cache.
+
+        Expired entries are dropped on access; hits are moved to the end
+        to keep the eviction order least-recently-used.
+
+        Args:
+            cache_key: Normalized cache key
+
+        Returns:
+            WeatherResponse if found and fresh, None otherwise
+        """
+        entry = self._l1_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        weather_data, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._l1_cache[cache_key]
+            return None
+
+        self._l1_cache.move_to_end(cache_key)
+        return weather_data
+
+    def _l1_set(self, cache_key: str, weather_data: WeatherResponse) -> None:
+        """
+        Store weather data in the in-memory L1 cache, evicting the
+        least-recently-used entry when the cache is full.
+
+        Args:
+            cache_key: Normalized cache key
+            weather_data: Weather data to cache
+        """
+        self._l1_cache[cache_key] = (
+            weather_data,
+            time.monotonic() + self._l1_ttl_seconds,
+        )
+        self._l1_cache.move_to_end(cache_key)
+
+        while len(self._l1_cache) > self._l1_max_entries:
+            self._l1_cache.popitem(last=False)
+
     async def get_weather(self, city: str) -> Optional[WeatherResponse]:
         """
         Get weather data from cache with retry logic.
@@ -126,11 +191,16 @@ class DynamoDBCacheService:
         Returns:
             WeatherResponse if found and valid, None otherwise
         """
+        cache_key = self._generate_cache_key(city)
+
+        # Check the in-memory L1 tier before touching DynamoDB
+        l1_weather = self._l1_get(cache_key)
+        if l1_weather is not None:
+            logger.debug("L1 cache hit for %s", city)
+            return l1_weather
 
         @dynamodb_retry(self.retry_config)
         def _get_weather_with_retry() -> Optional[WeatherResponse]:
-            cache_key = self._generate_cache_key(city)
-
             response = self.table.get_item(Key={"PK": cache_key, "SK": "DATA"})
 
             if "Item" in response:
@@ -152,7 +222,10 @@ class DynamoDBCacheService:
             return None
 
         try:
-            return _get_weather_with_retry()
+            weather_data = _get_weather_with_retry()
+            if weather_data is not None:
+                self._l1_set(cache_key, weather_data)
+            return weather_data
         except (ClientError, CacheError) as e:
             logger.error("DynamoDB error getting cache for %s: %s", city, e)
             # Don't raise exception - gracefully degrade to no cache
@@ -191,6 +264,8 @@ class DynamoDBCacheService:
             logger.debug("Cached weather data for %s", weather_data.city)
             return True
 
+        self._l1_set(self._generate_cache_key(weather_data.city), weather_data)
+
         try:
             return _set_weather_with_retry()
         except (ClientError, CacheError) as e:
@@ -199,10 +274,71 @@ class DynamoDBCacheService:
             )
             return False
 
+    def _batch_get_chunk(self, cache_keys: List[Dict]) -> Dict[str, WeatherResponse]:
+        """
+        Fetch a single chunk of cache keys (max 100) via BatchGetItem.
+
+        Retries UnprocessedKeys with exponential backoff in addition to the
+        standard retry logic for throttling errors.
+
+        Args:
+            cache_keys: List of DynamoDB key dictionaries (at most 100)
+
+        Returns:
+            Dictionary mapping city names to WeatherResponse objects
+        """
+
+        @dynamodb_retry(self.retry_config)
+        def _batch_get_chunk_with_retry() -> Dict[str, WeatherResponse]:
+            cached_weather = {}
+            remaining_keys = cache_keys
+
+            for attempt in range(1, self.retry_config.max_attempts + 1):
+                response = self.dynamodb.batch_get_item(
+                    RequestItems={self.table_name: {"Keys": remaining_keys}}
+                )
+
+                for item in response.get("Responses", {}).get(self.table_name, []):
+                    if self._is_cache_valid(item):
+                        city_name = item["city"]
+                        cached_weather[city_name] = WeatherResponse(
+                            city=city_name,
+                            temperature=float(item["temperature"]),
+                            description=item["description"],
+                            humidity=int(item["humidity"]),
+                            timestamp=item["timestamp"],
+                        )
+
+                # Retry any keys DynamoDB could not process in this call
+                remaining_keys = (
+                    response.get("UnprocessedKeys", {})
+                    .get(self.table_name, {})
+                    .get("Keys", [])
+                )
+                if not remaining_keys:
+                    break
+
+                if attempt < self.retry_config.max_attempts:
+                    time.sleep(calculate_delay(attempt, self.retry_config))
+
+            if remaining_keys:
+                logger.warning(
+                    "Batch get left %d unprocessed keys after %d attempts",
+                    len(remaining_keys),
+                    self.retry_config.max_attempts,
+                )
+
+            return cached_weather
+
+        return _batch_get_chunk_with_retry()
+
     async def batch_get_weather(self, cities: List[str]) -> Dict[str, WeatherResponse]:
         """
         Get weather data for multiple cities from cache with retry logic.
 
+        Keys are split into 100-item chunks (the BatchGetItem hard limit)
+        and chunks are fetched concurrently.
+
         Args:
             cities: List of city names
 
@@ -212,47 +348,104 @@ class DynamoDBCacheService:
         if not cities:
             return {}
 
-        @dynamodb_retry(self.retry_config)
-        def _batch_get_weather_with_retry() -> Dict[str, WeatherResponse]:
-            # Prepare batch get request (limit to 100 items per DynamoDB constraints)
-            cache_keys = [
-                {"PK": self._generate_cache_key(city), "SK": "DATA"}
-                for city in cities[:100]
-            ]
-
-            response = self.dynamodb.batch_get_item(
-                RequestItems={self.table_name: {"Keys": cache_keys}}
-            )
+        # Peel off in-memory L1 hits before consulting DynamoDB
+        cached_weather = {}
+        cities_to_fetch = []
+        for city in cities:
+            l1_weather = self._l1_get(self._generate_cache_key(city))
+            if l1_weather is not None:
+                cached_weather[l1_weather.city] = l1_weather
+            else:
+                cities_to_fetch.append(city)
+
+        if not cities_to_fetch:
+            logger.debug("L1 cache hit for all %d cities", len(cities))
+            return cached_weather
 
-            cached_weather = {}
-            for item in response.get("Responses", {}).get(self.table_name, []):
-                if self._is_cache_valid(item):
-                    city_name = item["city"]
-                    cached_weather[city_name] = WeatherResponse(
-                        city=city_name,
-                        temperature=float(item["temperature"]),
-                        description=item["description"],
-                        humidity=int(item["humidity"]),
-                        timestamp=item["timestamp"],
+        cache_keys = [
+            {"PK": self._generate_cache_key(city), "SK": "DATA"}
+            for city in cities_to_fetch
+        ]
+        chunks = [
+            cache_keys[i : i + BATCH_GET_MAX_KEYS]
+            for i in range(0, len(cache_keys), BATCH_GET_MAX_KEYS)
+        ]
+
+        chunk_results = await asyncio.gather(
+            *[asyncio.to_thread(self._batch_get_chunk, chunk) for chunk in chunks],
+            return_exceptions=True,
+        )
+
+        for result in chunk_results:
+            if isinstance(result, dict):
+                for weather_data in result.values():
+                    self._l1_set(
+                        self._generate_cache_key(weather_data.city), weather_data
                     )
+                cached_weather.update(result)
+            elif isinstance(result, (ClientError, CacheError)):
+                logger.error("DynamoDB error in batch get: %s", result)
+            else:
+                raise result
+
+        logger.debug(
+            "Batch cache hit for %d out of %d cities",
+            len(cached_weather),
+            len(cities),
+        )
+        return cached_weather
 
-            logger.debug(
-                "Batch cache hit for %d out of %d cities",
-                len(cached_weather),
-                len(cities),
-            )
-            return cached_weather
+    def _batch_set_chunk(self, batch_items: List[Dict]) -> int:
+        """
+        Write a single chunk of put requests (max 25) via BatchWriteItem.
 
-        try:
-            return _batch_get_weather_with_retry()
-        except (ClientError, CacheError) as e:
-            logger.error("DynamoDB error in batch get: %s", e)
-            return {}
+        Retries UnprocessedItems with exponential backoff in addition to the
+        standard retry logic for throttling errors.
+
+        Args:
+            batch_items: List of DynamoDB put requests (at most 25)
+
+        Returns:
+            Number of items successfully written
+        """
+
+        @dynamodb_retry(self.retry_config)
+        def _batch_set_chunk_with_retry() -> int:
+            remaining_items = batch_items
+
+            for attempt in range(1, self.retry_config.max_attempts + 1):
+                response = self.dynamodb.batch_write_item(
+                    RequestItems={self.table_name: remaining_items}
+                )
+
+                # Retry any items DynamoDB could not process in this call
+                remaining_items = response.get("UnprocessedItems", {}).get(
+                    self.table_name, []
+                )
+                if not remaining_items:
+                    break
+
+                if attempt < self.retry_config.max_attempts:
+                    time.sleep(calculate_delay(attempt, self.retry_config))
+
+            if remaining_items:
+                logger.warning(
+                    "Batch set left %d unprocessed items after %d attempts",
+                    len(remaining_items),
+                    self.retry_config.max_attempts,
+                )
+
+            return len(batch_items) - len(remaining_items)
+
+        return _batch_set_chunk_with_retry()
 
     async def batch_set_weather(self, weather_data_list: List[WeatherResponse]) -> int:
         """
         Store multiple weather data entries in cache with retry logic.
 
+        Items are split into 25-item chunks (the BatchWriteItem hard limit)
+        and chunks are written concurrently.
+
         Args:
             weather_data_list: List of weather data to cache
 
@@ -262,44 +455,51 @@ class DynamoDBCacheService:
         if not weather_data_list:
             return 0
 
-        @dynamodb_retry(self.retry_config)
-        def _batch_set_weather_with_retry() -> int:
-            # Prepare batch write request (limit to 25 items per DynamoDB constraints)
-            batch_items = []
-            expires_at = self._generate_expires_at()
-
-            for weather_data in weather_data_list[:25]:
-                cache_key = self._generate_cache_key(weather_data.city)
-
-                batch_items.append(
-                    {
-                        "PutRequest": {
-                            "Item": {
-                                "PK": cache_key,
-                                "SK": "DATA",
-                                "city": weather_data.city,
-                                "temperature": Decimal(str(weather_data.temperature)),
-                                "description": weather_data.description,
-                                "humidity": weather_data.humidity,
-                                "timestamp": weather_data.timestamp,
-                                "expires_at": expires_at,
-                                "created_at": datetime.utcnow().isoformat(),
-                            }
-                        }
+        for weather_data in weather_data_list:
+            self._l1_set(self._generate_cache_key(weather_data.city), weather_data)
+
+        expires_at = self._generate_expires_at()
+        created_at = datetime.utcnow().isoformat()
+
+        batch_items = [
+            {
+                "PutRequest": {
+                    "Item": {
+                        "PK": self._generate_cache_key(weather_data.city),
+                        "SK": "DATA",
+                        "city": weather_data.city,
+                        "temperature": Decimal(str(weather_data.temperature)),
+                        "description": weather_data.description,
+                        "humidity": weather_data.humidity,
+                        "timestamp": weather_data.timestamp,
+                        "expires_at": expires_at,
+                        "created_at": created_at,
                     }
-                )
-
-            # Execute batch write
-            self.dynamodb.batch_write_item(RequestItems={self.table_name: batch_items})
-
-            logger.debug("Batch cached %d weather entries", len(batch_items))
-            return len(batch_items)
+                }
+            }
+            for weather_data in weather_data_list
+        ]
+        chunks = [
+            batch_items[i : i + BATCH_WRITE_MAX_ITEMS]
+            for i in range(0, len(batch_items), BATCH_WRITE_MAX_ITEMS)
+        ]
+
+        chunk_results = await asyncio.gather(
+            *[asyncio.to_thread(self._batch_set_chunk, chunk) for chunk in chunks],
+            return_exceptions=True,
+        )
 
-        try:
-            return _batch_set_weather_with_retry()
-        except (ClientError, CacheError) as e:
-            logger.error("DynamoDB error in batch set: %s", e)
-            return 0
+        cached_count = 0
+        for result in chunk_results:
+            if isinstance(result, int):
+                cached_count += result
+            elif isinstance(result, (ClientError, CacheError)):
+                logger.error("DynamoDB error in batch set: %s", result)
+            else:
+                raise result
+
+        logger.debug("Batch cached %d weather entries", cached_count)
+        return cached_count
 
     async def health_check(self) -> bool:
         """
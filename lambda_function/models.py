@@ -4,9 +4,11 @@ Pydantic models for request/response validation.
 
 from typing import List
 from pydantic import BaseModel
+from pydantic.dataclasses import dataclass
 
 
-class WeatherResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class WeatherResponse:
     """Response model for single city weather data."""
 
     city: str
@@ -22,7 +24,8 @@ class BatchWeatherRequest(BaseModel):
     cities: List[str]
 
 
-class BatchWeatherResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class BatchWeatherResponse:
     """Response model for batch weather queries."""
 
     results: List[WeatherResponse]
@@ -204,7 +204,8 @@ def retry_sync(
                             delay,
                         )
 
-                    time.sleep(delay)
+                    if delay > 0:
+                        time.sleep(delay)
 
             raise RetryError(
                 f"Function {func.__name__} failed after {config.max_attempts} attempts",
@@ -283,7 +284,8 @@ def retry_async(
                             delay,
                         )
 
-                    await asyncio.sleep(delay)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
 
             raise RetryError(
                 f"Function {func.__name__} failed after {config.max_attempts} attempts",
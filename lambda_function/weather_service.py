@@ -2,10 +2,14 @@
 Weather service layer with caching and business logic.
 """
 
+import asyncio
 import os
 import logging
 from datetime import datetime, timezone
 from typing import List, Dict
+
+import aiohttp
+
 from external_api import (
     OpenWeatherMapClient,
     WeatherAPIError,
@@ -13,6 +17,7 @@ from external_api import (
 )
 from models import WeatherResponse, BatchWeatherResponse
 from cache_service import DynamoDBCacheService, CacheError
+from retry_service import RetryError
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +83,9 @@ class WeatherService:
         except WeatherAPIError:
             # Re-raise API errors as-is
             raise
-        except Exception as e:
+        except (CacheError, RetryError, asyncio.TimeoutError, aiohttp.ClientError) as e:
+            # Targeted list only - CancelledError and truly unexpected
+            # exceptions propagate cleanly (important for Lambda timeouts)
             logger.error("Unexpected error in weather service for %s: %s", city, str(e))
             raise WeatherAPIError(f"Service error for {city}") from e
 
@@ -162,7 +169,10 @@ class WeatherService:
                 successful_requests=len(results),
             )
 
-        except Exception as e:
+        except WeatherAPIError:
+            # Re-raise API errors as-is
+            raise
+        except (CacheError, RetryError, asyncio.TimeoutError, aiohttp.ClientError) as e:
             logger.error("Unexpected error in batch weather service: %s", str(e))
             raise WeatherAPIError("Batch service error") from e
 
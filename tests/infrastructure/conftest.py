@@ -0,0 +1,67 @@
+"""
+Infrastructure 테스트 공통 fixture 모음
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import boto3
+import placebo
+import pytest
+from utils.constants import EnvironmentConfig
+from utils.prefixes import ResourcePrefixes, Tags
+
+# placebo로 기록된 AWS 응답 JSON fixture 경로
+PLACEBO_DATA_DIR = Path(__file__).resolve().parents[1] / "fixtures" / "placebo"
+
+
+@pytest.fixture(scope="session")
+def env_configs():
+    """환경별 설정을 세션당 한 번만 로딩하여 공유"""
+    return {
+        env: EnvironmentConfig.get_config(env) for env in ("dev", "staging", "prod")
+    }
+
+
+@pytest.fixture(scope="session")
+def common_tags():
+    """환경별 공통 태그를 세션당 한 번만 생성하여 공유"""
+    return {
+        env: Tags.get_common_tags(env, ResourcePrefixes.WEATHER_API)
+        for env in ("dev", "staging", "prod")
+    }
+
+
+@pytest.fixture(scope="session")
+def cdk_stacks():
+    """CDK 스택 클래스들을 세션당 한 번만 import하여 공유
+
+    aws-cdk-lib import 비용이 크므로 개별 테스트의 try/except import를
+    이 fixture의 단일 속성 조회로 대체함
+    """
+    pytest.importorskip("aws_cdk")
+
+    from stacks.apigateway_stack import APIGatewayStack
+    from stacks.dynamodb_stack import DynamoDbStack
+    from stacks.lambda_stack import LambdaStack
+
+    return SimpleNamespace(
+        lambda_=LambdaStack, api=APIGatewayStack, dynamodb=DynamoDbStack
+    )
+
+
+@pytest.fixture
+def placebo_session():
+    """기록된 STS 응답을 재생(playback)하는 boto3 Session fixture
+
+    네트워크 호출 없이 tests/fixtures/placebo/ 아래 JSON을 재생하므로,
+    새로운 AWS 호출 흐름이 추가되면 코드 대신 fixture 파일만 추가하면 됨
+    """
+    session = boto3.Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name="us-east-1",
+    )
+    pill = placebo.attach(session, data_path=str(PLACEBO_DATA_DIR / "sts_success"))
+    pill.playback()
+    return session
@@ -0,0 +1,117 @@
+"""
+Shared fixtures for Lambda function tests.
+"""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+import uvloop
+from asgi_lifespan import LifespanManager
+from dotenv import load_dotenv
+from httpx import ASGITransport, AsyncClient
+
+from lambda_function.lambda_function import app
+from models import BatchWeatherResponse, WeatherResponse
+
+# Default mock data served by the shared WeatherService mock
+MOCK_WEATHER_DATA = WeatherResponse(
+    city="Seoul",
+    temperature=22.5,
+    description="Partly cloudy",
+    humidity=65,
+    timestamp="2024-01-01T12:00:00+00:00",
+)
+
+MOCK_HEALTHY_STATUS = {
+    "status": "healthy",
+    "timestamp": "2024-01-01T12:00:00Z",
+    "checks": {"openweathermap_api": "healthy", "cache": "healthy"},
+}
+
+# Install uvloop before pytest-asyncio builds the session loop; the plugin
+# reads the current policy, so this replaces the deprecated override of
+# its event_loop_policy fixture.
+asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+@pytest.fixture(scope="session")
+def test_api_key():
+    """Load .env.local once per session and provide the test API key.
+
+    Replaces the old import-time load_dotenv + raise, which ran on
+    every collection and aborted unrelated test selections.
+    """
+    load_dotenv(".env.local")
+    api_key = os.getenv("TEST_OPENWEATHER_API_KEY")
+    if not api_key:
+        pytest.skip(
+            "TEST_OPENWEATHER_API_KEY not set. "
+            "Copy .env.local.example to .env.local and set your API key."
+        )
+    return api_key
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Create a single shared async test client for the FastAPI app.
+
+    Session-scoped so the ASGI lifespan and client plumbing are set up
+    once for the whole suite. The in-process ASGI transport talks to
+    the app directly, skipping TestClient's per-request thread portal.
+    """
+    async with (
+        LifespanManager(app),
+        AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as async_client,
+    ):
+        # Warm up lazy app initialization (route compilation, OpenAPI
+        # schema generation) so the first real test doesn't pay it
+        await async_client.get("/dev/openapi.json")
+        await async_client.get("/")
+        yield async_client
+
+
+@pytest.fixture(scope="session")
+def mock_weather_service():
+    """Patch WeatherService in the handler module once per session.
+
+    The handler imports WeatherService into its own namespace, so the
+    patch target must be lambda_function.lambda_function.WeatherService
+    (patching weather_service.WeatherService would be a silent no-op).
+    Tests override return_value/side_effect on the yielded instance.
+    """
+    with patch("lambda_function.lambda_function.WeatherService") as mock_class:
+        service_instance = AsyncMock()
+        mock_class.return_value = service_instance
+        yield service_instance
+
+
+@pytest.fixture(autouse=True)
+def _weather_service_defaults(request):
+    """Reset the shared WeatherService mock to default behavior per test.
+
+    Pure-Python tests (pydantic models, retry logic) never touch the app,
+    so they skip the mock patching/reset instead of paying client-fixture
+    setup they don't use.
+    """
+    if not {"client", "mock_weather_service"} & set(request.fixturenames):
+        yield
+        return
+
+    mock_weather_service = request.getfixturevalue("mock_weather_service")
+    mock_weather_service.reset_mock()
+    mock_weather_service.get_weather.side_effect = None
+    mock_weather_service.get_weather.return_value = MOCK_WEATHER_DATA
+    mock_weather_service.get_batch_weather.side_effect = None
+    mock_weather_service.get_batch_weather.return_value = BatchWeatherResponse(
+        results=[MOCK_WEATHER_DATA, MOCK_WEATHER_DATA],
+        total_cities=2,
+        successful_requests=2,
+    )
+    mock_weather_service.health_check.side_effect = None
+    mock_weather_service.health_check.return_value = dict(MOCK_HEALTHY_STATUS)
+    yield
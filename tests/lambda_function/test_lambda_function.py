@@ -3,44 +3,55 @@ Comprehensive test suite for the weather API Lambda function.
 Tests all endpoints, validation, error handling, and edge cases.
 """
 
-import os
-import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, AsyncMock
-from datetime import datetime
-from dotenv import load_dotenv
+import asyncio
+import dataclasses
+import functools
+import re
 
-# Load environment variables from .env.local file
-load_dotenv(".env.local")
+import orjson
+import pytest
+from fastapi.middleware.cors import CORSMiddleware
+from pydantic import TypeAdapter
 
-# Import the FastAPI app
-from lambda_function.lambda_function import app
-from lambda_function.models import (
+# Import models/exceptions from the same namespace the handler uses
+# (the handler does 'from models import ...', so lambda_function.models
+# would be a distinct twin class that fails response validation)
+from models import (
     WeatherResponse,
     BatchWeatherRequest,
     BatchWeatherResponse,
     ErrorResponse,
 )
-from lambda_function.external_api import WeatherAPIError
-
-
-# Test client fixture
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
-
-
-# Mock API key for testing
-# Get API key from environment variable
-TEST_API_KEY = os.getenv("TEST_OPENWEATHER_API_KEY")
+from external_api import WeatherAPIError
+from lambda_function.lambda_function import app
 
-if not TEST_API_KEY:
-    raise ValueError(
-        "TEST_OPENWEATHER_API_KEY environment variable is required. "
-        "Please copy .env.local.example to .env.local and set your API key."
-    )
 
+# Validators built once at import; reused by the model-validation tests
+_WR_ADAPTER = TypeAdapter(WeatherResponse)
+_BWR_ADAPTER = TypeAdapter(BatchWeatherResponse)
+
+# UTC ISO-8601 timestamp shape, e.g. 2024-01-01T12:00:00+00:00
+_ISO_UTC = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?\+00:00")
+
+# Standard three-city batch shared by the batch and workflow tests,
+# pre-serialized once so POSTs skip the per-request json.dumps
+_BATCH_CITIES = ("seoul", "busan", "tokyo")
+_BATCH_PAYLOAD = {"cities": list(_BATCH_CITIES)}
+_BATCH_PAYLOAD_BYTES = orjson.dumps(_BATCH_PAYLOAD)
+
+# MAX_BATCH_CITIES = 10 distinct cities, built once at import
+_MAX_BATCH_CITIES = (
+    "seoul",
+    "tokyo",
+    "paris",
+    "london",
+    "berlin",
+    "madrid",
+    "rome",
+    "vienna",
+    "prague",
+    "warsaw",
+)
 
 # Mock weather data
 MOCK_WEATHER_DATA = WeatherResponse(
@@ -52,77 +63,138 @@ MOCK_WEATHER_DATA = WeatherResponse(
 )
 
 
-class TestRootEndpoint:
-    """Test cases for the root endpoint."""
+@functools.lru_cache(maxsize=None)
+def _wr(city: str) -> WeatherResponse:
+    """Memoized per-city mock WeatherResponse (validated once per city)."""
+    return dataclasses.replace(MOCK_WEATHER_DATA, city=city.capitalize())
 
-    def test_root_endpoint_success(self, client):
-        """Test that root endpoint returns correct API information."""
-        response = client.get("/")
 
-        assert response.status_code == 200
-        data = response.json()
+def jget(response):
+    """Decode a response body with orjson (faster than stdlib json.loads)."""
+    return orjson.loads(response.content)
 
-        assert data["service"] == "Weather API Service"
-        assert data["version"] == "1.0.0"
-        assert data["status"] == "active"
-        assert "endpoints" in data
-        assert (
-            data["endpoints"]["single_weather"]
-            == "/weather/{city}?api_key=YOUR_API_KEY"
-        )
-        assert data["endpoints"]["batch_weather"] == "/weather/batch"
-        assert data["endpoints"]["health_check"] == "/health?api_key=YOUR_API_KEY"
-        assert data["endpoints"]["documentation"] == "/docs"
 
-    def test_root_endpoint_response_structure(self, client):
-        """Test that root endpoint response has correct structure."""
-        response = client.get("/")
-        data = response.json()
+@pytest.fixture(scope="module")
+async def weather_response_data(client, mock_weather_service, test_api_key):
+    """Perform the happy-path weather request once and share the JSON body."""
+    mock_weather_service.get_weather.return_value = MOCK_WEATHER_DATA
+
+    response = await client.get(f"/weather/seoul?api_key={test_api_key}")
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture(scope="module")
+async def root_payload(client):
+    """Issue GET / once per module and share the JSON body."""
+    response = await client.get("/")
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture(scope="module")
+async def openapi_response(client):
+    """Fetch the OpenAPI schema once per module and share the response.
+
+    Schema generation walks every route and Pydantic model, so the
+    documentation tests share one GET instead of regenerating it each.
+    """
+    response = await client.get("/dev/openapi.json")
+    assert response.status_code == 200
+    return response
+
+
+@pytest.fixture(scope="module")
+def openapi_schema(openapi_response):
+    """Parsed OpenAPI schema shared by the documentation tests."""
+    return openapi_response.json()
+
+
+@pytest.fixture(scope="module")
+def max_batch_response():
+    """Build the MAX_BATCH_CITIES-sized batch response once per module."""
+    return BatchWeatherResponse(
+        results=[_wr(city) for city in _MAX_BATCH_CITIES],
+        total_cities=10,
+        successful_requests=10,
+    )
+
 
-        required_fields = ["service", "version", "status", "endpoints"]
-        for field in required_fields:
-            assert field in data
+class TestRootEndpoint:
+    """Test cases for the root endpoint."""
+
+    @pytest.mark.parametrize(
+        "key,expected",
+        [
+            ("service", "Weather API Service"),
+            ("version", "1.0.0"),
+            ("status", "active"),
+            ("endpoints.single_weather", "/weather/{city}?api_key=YOUR_API_KEY"),
+            ("endpoints.batch_weather", "/weather/batch"),
+            ("endpoints.health_check", "/health?api_key=YOUR_API_KEY"),
+            ("endpoints.documentation", "/docs"),
+        ],
+    )
+    def test_root_endpoint_fields(self, root_payload, key, expected):
+        """Validate root endpoint API information, one field per case.
+
+        GET / is issued once by the module-scoped root_payload fixture;
+        a missing field surfaces as a None value for its dotted key.
+        """
+        value = functools.reduce(
+            lambda d, k: d.get(k) if isinstance(d, dict) else None,
+            key.split("."),
+            root_payload,
+        )
+        assert value == expected
 
 
 class TestHealthEndpoint:
     """Test cases for the health check endpoint."""
 
-    def test_health_check_without_api_key(self, client):
+    async def test_health_check_without_api_key(self, client):
         """Test health check without API key returns validation error."""
-        response = client.get("/health")
+        response = await client.get("/health")
 
         assert response.status_code == 400
         data = response.json()
         assert "API key is required" in data["detail"]
 
-    @patch("lambda_function.lambda_function.WeatherService")
-    def test_health_check_with_valid_api_key(self, mock_weather_service, client):
+    async def test_health_check_with_valid_api_key(
+        self, mock_weather_service, client, test_api_key
+    ):
         """Test health check with valid API key validates external API."""
         # Mock successful health check
-        mock_service_instance = AsyncMock()
-        mock_service_instance.health_check.return_value = {
+        mock_weather_service.health_check.return_value = {
             "status": "healthy",
             "timestamp": "2024-01-01T12:00:00Z",
             "checks": {"openweathermap_api": "healthy", "cache": "healthy"},
         }
-        mock_weather_service.return_value = mock_service_instance
 
         # Use header for API key
-        headers = {"X-API-Key": TEST_API_KEY}
-        response = client.get("/health", headers=headers)
+        headers = {"X-API-Key": test_api_key}
+        response = await client.get("/health", headers=headers)
 
         assert response.status_code == 200
         data = response.json()
 
         assert data["status"] == "healthy"
         assert "checks" in data
-        # Note: Mock verification skipped - testing actual API integration
+        mock_weather_service.health_check.assert_awaited_once()
 
-    def test_health_check_with_invalid_api_key(self, client):
+    async def test_health_check_with_invalid_api_key(
+        self, mock_weather_service, client
+    ):
         """Test health check with invalid API key returns error status."""
-        # Use obviously invalid API key to trigger error
+        # Mock unhealthy status for an invalid API key
+        mock_weather_service.health_check.return_value = {
+            "status": "unhealthy",
+            "timestamp": "2024-01-01T12:00:00Z",
+            "checks": {"openweathermap_api": "unhealthy", "cache": "healthy"},
+        }
+
         headers = {"X-API-Key": "invalid_key_12345"}
-        response = client.get("/health", headers=headers)
+        response = await client.get("/health", headers=headers)
 
         assert response.status_code == 200
         data = response.json()
@@ -136,181 +208,132 @@ class TestHealthEndpoint:
 class TestSingleWeatherEndpoint:
     """Test cases for the single city weather endpoint."""
 
-    @patch("weather_service.WeatherService")
-    def test_get_weather_success(self, mock_weather_service, client):
-        """Test successful weather retrieval for a city."""
-        # Mock the WeatherService
-        mock_service_instance = AsyncMock()
-        mock_service_instance.get_weather.return_value = MOCK_WEATHER_DATA
-        mock_weather_service.return_value = mock_service_instance
-
-        city = "seoul"
-        response = client.get(f"/weather/{city}?api_key={TEST_API_KEY}")
-
-        assert response.status_code == 200
-        data = response.json()
-
-        # Validate response structure
-        assert data["city"] == "Seoul"  # API returns capitalized city name
-        assert isinstance(data["temperature"], float)
-        assert isinstance(data["description"], str)
-        assert isinstance(data["humidity"], int)
-        assert isinstance(data["timestamp"], str)
-
-        # Validate data presence and types (real API data varies)
-        assert "temperature" in data
-        assert "description" in data
-        assert "humidity" in data
+    @pytest.mark.parametrize(
+        "check",
+        [
+            pytest.param(lambda d: d["city"] == "Seoul", id="city-capitalized"),
+            pytest.param(
+                lambda d: isinstance(d["temperature"], float), id="temperature-float"
+            ),
+            pytest.param(
+                lambda d: isinstance(d["description"], str), id="description-str"
+            ),
+            pytest.param(lambda d: isinstance(d["humidity"], int), id="humidity-int"),
+            pytest.param(
+                lambda d: _ISO_UTC.fullmatch(d["timestamp"]) is not None,
+                id="timestamp-iso-format",
+            ),
+            pytest.param(
+                lambda d: _WR_ADAPTER.validate_python(d).city == "Seoul",
+                id="model-validation",
+            ),
+        ],
+    )
+    def test_get_weather_success(self, weather_response_data, check):
+        """Validate the happy-path weather response, one invariant per case.
 
-        # Note: Mock verification skipped due to import path issues
-        # Testing actual API response structure instead
+        The request itself is performed once by the module-scoped
+        weather_response_data fixture; each case only inspects the body.
+        """
+        assert check(weather_response_data)
 
-    def test_get_weather_missing_api_key(self, client):
+    async def test_get_weather_missing_api_key(self, client):
         """Test weather endpoint without API key returns error."""
-        response = client.get("/weather/seoul")
+        response = await client.get("/weather/seoul")
 
         assert response.status_code == 400  # API key required error
 
-    def test_get_weather_empty_api_key(self, client):
+    async def test_get_weather_empty_api_key(self, client):
         """Test weather endpoint with empty API key returns error."""
-        response = client.get("/weather/seoul?api_key=")
+        response = await client.get("/weather/seoul?api_key=")
 
         assert response.status_code == 400
         data = response.json()
         assert "API key is required" in data["detail"]
 
-    @patch("weather_service.WeatherService")
-    def test_get_weather_invalid_api_key(self, mock_weather_service, client):
-        """Test weather endpoint with invalid API key."""
-
-        mock_service_instance = AsyncMock()
-        mock_service_instance.get_weather.side_effect = WeatherAPIError(
-            "Invalid API key", 401
-        )
-        mock_weather_service.return_value = mock_service_instance
-
-        response = client.get(f"/weather/seoul?api_key=Invalid-api-key")
-
-        assert response.status_code == 401
-        data = response.json()
-        assert "Invalid API key" in data["detail"]
-
-    @patch("weather_service.WeatherService")
-    def test_get_weather_city_not_found(self, mock_weather_service, client):
-        """Test weather endpoint with non-existent city."""
-
-        mock_service_instance = AsyncMock()
-        mock_service_instance.get_weather.side_effect = WeatherAPIError(
-            "City not found", 404
-        )
-        mock_weather_service.return_value = mock_service_instance
-
-        response = client.get(f"/weather/nonexistent?api_key={TEST_API_KEY}")
-
-        assert response.status_code == 404
+    @pytest.mark.parametrize(
+        "path,error,expected_status,expected_detail",
+        [
+            pytest.param(
+                "/weather/seoul",
+                WeatherAPIError("Invalid API key", 401),
+                401,
+                "Invalid API key",
+                id="invalid-key",
+            ),
+            pytest.param(
+                "/weather/nonexistent",
+                WeatherAPIError("City not found", 404),
+                404,
+                "City 'nonexistent' not found",
+                id="city-missing",
+            ),
+        ],
+    )
+    async def test_get_weather_error_paths(
+        self,
+        mock_weather_service,
+        client,
+        path,
+        error,
+        expected_status,
+        expected_detail,
+    ):
+        """Test that WeatherAPIError maps to the expected status and detail."""
+        mock_weather_service.get_weather.side_effect = error
+
+        response = await client.get(f"{path}?api_key=some-api-key")
+
+        assert response.status_code == expected_status
         data = response.json()
-        assert "City 'nonexistent' not found" in data["detail"]
+        assert expected_detail in data["detail"]
 
     @pytest.mark.skip(
         reason="Service unavailable scenarios require mocking - not testable with real API"
     )
-    def test_get_weather_service_unavailable(self, client):
+    async def test_get_weather_service_unavailable(self, client):
         """Test weather endpoint when external service is unavailable."""
         # This test requires mocking external service failures
         # Cannot be tested with real API integration
         pass
 
-    @patch("weather_service.WeatherService")
-    def test_get_weather_different_cities(self, mock_weather_service, client):
+    @pytest.mark.parametrize("city", ["seoul", "busan", "tokyo", "paris", "london"])
+    async def test_get_weather_different_cities(
+        self, mock_weather_service, client, city, test_api_key
+    ):
         """Test weather endpoint with different city names."""
-        mock_service_instance = AsyncMock()
-        mock_weather_service.return_value = mock_service_instance
-
-        cities = ["seoul", "busan", "tokyo", "paris", "london"]
-
-        for city in cities:
-            # Create city-specific mock data
-            city_weather_data = WeatherResponse(
-                city=city.capitalize(),  # API returns capitalized city names
-                temperature=22.5,
-                description="Partly cloudy",
-                humidity=65,
-                timestamp="2024-01-01T12:00:00+00:00",
-            )
-            mock_service_instance.get_weather.return_value = city_weather_data
-
-            response = client.get(f"/weather/{city}?api_key={TEST_API_KEY}")
-            assert response.status_code == 200
-            data = response.json()
-            assert (
-                data["city"] == city.capitalize()
-            )  # API returns capitalized city name
-
-    def test_get_weather_timestamp_format(self, client):
-        """Test that timestamp is in correct ISO format."""
-        with patch("weather_service.WeatherService") as mock_weather_service:
-            mock_service_instance = AsyncMock()
-            mock_service_instance.get_weather.return_value = MOCK_WEATHER_DATA
-            mock_weather_service.return_value = mock_service_instance
-
-            response = client.get(f"/weather/tokyo?api_key={TEST_API_KEY}")
-            data = response.json()
+        # API returns capitalized city names
+        mock_weather_service.get_weather.return_value = _wr(city)
 
-            timestamp = data["timestamp"]
-            assert timestamp.endswith("+00:00")
-
-            # Verify it's a valid ISO format (should not raise exception)
-            datetime.fromisoformat(timestamp)
-
-    def test_get_weather_response_model_validation(self, client):
-        """Test that response matches WeatherResponse model."""
-        with patch("weather_service.WeatherService") as mock_weather_service:
-            mock_service_instance = AsyncMock()
-            mock_service_instance.get_weather.return_value = MOCK_WEATHER_DATA
-            mock_weather_service.return_value = mock_service_instance
-
-            response = client.get(f"/weather/seoul?api_key={TEST_API_KEY}")
-            data = response.json()
-
-            # Should not raise validation error
-            weather_response = WeatherResponse(**data)
-            assert weather_response.city == "Seoul"  # API returns capitalized city name
+        response = await client.get(f"/weather/{city}?api_key={test_api_key}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["city"] == city.capitalize()  # API returns capitalized city name
 
 
 class TestBatchWeatherEndpoint:
     """Test cases for the batch weather endpoint."""
 
-    @patch("weather_service.WeatherService")
-    def test_batch_weather_success(self, mock_weather_service, client):
+    async def test_batch_weather_success(
+        self, mock_weather_service, client, test_api_key
+    ):
         """Test successful batch weather retrieval."""
-        # Mock the WeatherService
-        mock_service_instance = AsyncMock()
-
-        cities = ["seoul", "busan", "tokyo"]
+        cities = _BATCH_CITIES
         mock_batch_response = BatchWeatherResponse(
-            results=[
-                WeatherResponse(
-                    city=city.capitalize(),  # API returns capitalized city names
-                    temperature=22.5,
-                    description="Partly cloudy",
-                    humidity=65,
-                    timestamp="2024-01-01T12:00:00+00:00",
-                )
-                for city in cities
-            ],
+            results=[_wr(city) for city in cities],
             total_cities=len(cities),
             successful_requests=len(cities),
         )
-        mock_service_instance.get_batch_weather.return_value = mock_batch_response
-        mock_weather_service.return_value = mock_service_instance
+        mock_weather_service.get_batch_weather.return_value = mock_batch_response
 
-        payload = {"cities": cities}
-        headers = {"X-API-Key": TEST_API_KEY}
+        headers = {"X-API-Key": test_api_key, "Content-Type": "application/json"}
 
-        response = client.post("/weather/batch", json=payload, headers=headers)
+        response = await client.post(
+            "/weather/batch", content=_BATCH_PAYLOAD_BYTES, headers=headers
+        )
 
         assert response.status_code == 200
-        data = response.json()
+        data = jget(response)
 
         assert data["total_cities"] == len(cities)
         assert data["successful_requests"] == len(cities)
@@ -325,182 +348,148 @@ class TestBatchWeatherEndpoint:
             assert "description" in result
             assert "humidity" in result
 
-        # Note: Mock verification skipped due to import path issues
-        # Testing actual API response structure instead
+        mock_weather_service.get_batch_weather.assert_awaited_once()
 
-    @patch("weather_service.WeatherService")
-    def test_batch_weather_single_city(self, mock_weather_service, client):
+    async def test_batch_weather_single_city(
+        self, mock_weather_service, client, test_api_key
+    ):
         """Test batch endpoint with single city."""
-        mock_service_instance = AsyncMock()
-        mock_batch_response = BatchWeatherResponse(
+        mock_weather_service.get_batch_weather.return_value = BatchWeatherResponse(
             results=[MOCK_WEATHER_DATA], total_cities=1, successful_requests=1
         )
-        mock_service_instance.get_batch_weather.return_value = mock_batch_response
-        mock_weather_service.return_value = mock_service_instance
 
         payload = {"cities": ["seoul"]}
-        headers = {"X-API-Key": TEST_API_KEY}
+        headers = {"X-API-Key": test_api_key}
 
-        response = client.post("/weather/batch", json=payload, headers=headers)
+        response = await client.post("/weather/batch", json=payload, headers=headers)
 
         assert response.status_code == 200
-        data = response.json()
+        data = jget(response)
         assert data["total_cities"] == 1
         assert data["successful_requests"] == 1
         assert len(data["results"]) == 1
 
-    @patch("weather_service.WeatherService")
-    def test_batch_weather_max_cities(self, mock_weather_service, client):
+    async def test_batch_weather_max_cities(
+        self, mock_weather_service, client, test_api_key, max_batch_response
+    ):
         """Test batch endpoint with maximum allowed cities."""
-        mock_service_instance = AsyncMock()
-
-        cities = [
-            "seoul",
-            "tokyo",
-            "paris",
-            "london",
-            "berlin",
-            "madrid",
-            "rome",
-            "vienna",
-            "prague",
-            "warsaw",
-        ]  # MAX_BATCH_CITIES = 10
-        mock_batch_response = BatchWeatherResponse(
-            results=[
-                WeatherResponse(
-                    city=city.capitalize(),  # API returns capitalized city names
-                    temperature=22.5,
-                    description="Partly cloudy",
-                    humidity=65,
-                    timestamp="2024-01-01T12:00:00+00:00",
-                )
-                for city in cities
-            ],
-            total_cities=10,
-            successful_requests=10,
-        )
-        mock_service_instance.get_batch_weather.return_value = mock_batch_response
-        mock_weather_service.return_value = mock_service_instance
+        mock_weather_service.get_batch_weather.return_value = max_batch_response
 
-        payload = {"cities": cities}
-        headers = {"X-API-Key": TEST_API_KEY}
+        payload = {"cities": list(_MAX_BATCH_CITIES)}
+        headers = {"X-API-Key": test_api_key}
 
-        response = client.post("/weather/batch", json=payload, headers=headers)
+        response = await client.post("/weather/batch", json=payload, headers=headers)
 
         assert response.status_code == 200
-        data = response.json()
+        data = jget(response)
         assert data["total_cities"] == 10
         assert data["successful_requests"] == 10
 
-    def test_batch_weather_missing_api_key(self, client):
+    async def test_batch_weather_missing_api_key(self, client):
         """Test batch endpoint without API key."""
         payload = {"cities": ["seoul", "busan"]}
 
-        response = client.post("/weather/batch", json=payload)
+        response = await client.post("/weather/batch", json=payload)
 
         assert response.status_code == 400  # API key required error
         data = response.json()
         assert "API key is required" in data["detail"]
 
-    def test_batch_weather_empty_api_key(self, client):
+    async def test_batch_weather_empty_api_key(self, client):
         """Test batch endpoint with empty API key."""
         payload = {"cities": ["seoul", "busan"]}
         headers = {"X-API-Key": ""}
 
-        response = client.post("/weather/batch", json=payload, headers=headers)
+        response = await client.post("/weather/batch", json=payload, headers=headers)
 
         assert response.status_code == 400
         data = response.json()
         assert "API key is required" in data["detail"]
 
-    @patch("weather_service.WeatherService")
-    def test_batch_weather_invalid_api_key(self, mock_weather_service, client):
+    async def test_batch_weather_invalid_api_key(self, mock_weather_service, client):
         """Test batch endpoint with invalid API key."""
-
-        mock_service_instance = AsyncMock()
-        mock_service_instance.get_batch_weather.side_effect = WeatherAPIError(
-            "Invalid API key", 401
+        # Batch processing degrades gracefully: failures become empty results
+        mock_weather_service.get_batch_weather.return_value = BatchWeatherResponse(
+            results=[], total_cities=2, successful_requests=0
         )
-        mock_weather_service.return_value = mock_service_instance
 
         payload = {"cities": ["seoul", "busan"]}
         headers = {"X-API-Key": "invalid_key"}
 
-        response = client.post("/weather/batch", json=payload, headers=headers)
+        response = await client.post("/weather/batch", json=payload, headers=headers)
 
         assert (
             response.status_code == 200
         )  # Batch endpoint returns 200 even with API errors
-        data = response.json()
+        data = jget(response)
 
         # Check that no cities were successfully processed due to invalid API key
         assert data["successful_requests"] == 0
         assert data["total_cities"] == 2
 
-    def test_batch_weather_invalid_payload(self, client):
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param({}, id="missing-cities"),
+            pytest.param({"cities": "seoul"}, id="cities-not-list"),
+            pytest.param({"cities": [123]}, id="invalid-city-type"),
+        ],
+    )
+    async def test_batch_weather_invalid_payload(self, client, payload):
         """Test batch endpoint with invalid payload structure."""
-        invalid_payloads = [
-            {},  # Missing cities
-            {"cities": "seoul"},  # String instead of list
-            {"cities": [123]},  # Invalid city type
-        ]
+        response = await client.post("/weather/batch", json=payload)
+        assert response.status_code == 400  # API key required error comes first
 
-        for payload in invalid_payloads:
-            response = client.post("/weather/batch", json=payload)
-            assert response.status_code == 400  # API key required error comes first
-
-    def test_batch_weather_response_model_validation(self, client):
+    async def test_batch_weather_response_model_validation(
+        self, mock_weather_service, client, test_api_key
+    ):
         """Test that batch response matches BatchWeatherResponse model."""
-        with patch("weather_service.WeatherService") as mock_weather_service:
-            mock_service_instance = AsyncMock()
-            mock_batch_response = BatchWeatherResponse(
-                results=[MOCK_WEATHER_DATA, MOCK_WEATHER_DATA],
-                total_cities=2,
-                successful_requests=2,
-            )
-            mock_service_instance.get_batch_weather.return_value = mock_batch_response
-            mock_weather_service.return_value = mock_service_instance
+        mock_weather_service.get_batch_weather.return_value = BatchWeatherResponse(
+            results=[MOCK_WEATHER_DATA, MOCK_WEATHER_DATA],
+            total_cities=2,
+            successful_requests=2,
+        )
 
-            payload = {"cities": ["seoul", "busan"]}
-            headers = {"X-API-Key": TEST_API_KEY}
-            response = client.post("/weather/batch", json=payload, headers=headers)
-            data = response.json()
+        payload = {"cities": ["seoul", "busan"]}
+        headers = {"X-API-Key": test_api_key}
+        response = await client.post("/weather/batch", json=payload, headers=headers)
 
-            # Should not raise validation error
-            batch_response = BatchWeatherResponse(**data)
-            assert batch_response.total_cities == 2
+        # Parse and validate the raw body in one pydantic-core pass
+        batch_response = _BWR_ADAPTER.validate_json(response.content)
+        assert batch_response.total_cities == 2
+        mock_weather_service.get_batch_weather.assert_awaited_once()
 
 
 class TestPydanticModels:
     """Test cases for Pydantic model validation."""
 
-    def test_weather_response_model(self):
-        """Test WeatherResponse model validation."""
-        valid_data = {
-            "city": "seoul",
-            "temperature": 22.5,
-            "description": "Partly cloudy",
-            "humidity": 65,
-            "timestamp": "2024-01-01T12:00:00Z",
-        }
-
-        weather = WeatherResponse(**valid_data)
-        assert weather.city == "seoul"
-        assert weather.temperature == 22.5
-
-    def test_weather_response_model_invalid_data(self):
-        """Test WeatherResponse model with invalid data."""
-        invalid_data = {
-            "city": "seoul",
-            "temperature": "invalid",  # Should be float
-            "description": "Partly cloudy",
-            "humidity": 65,
-            "timestamp": "2024-01-01T12:00:00Z",
-        }
+    _WEATHER_BASE = {
+        "city": "seoul",
+        "temperature": 22.5,
+        "description": "Partly cloudy",
+        "humidity": 65,
+        "timestamp": "2024-01-01T12:00:00Z",
+    }
+
+    @pytest.mark.parametrize(
+        "overrides,raises",
+        [
+            pytest.param({}, False, id="valid"),
+            pytest.param({"temperature": "invalid"}, True, id="invalid-temperature"),
+            pytest.param({"humidity": "invalid"}, True, id="invalid-humidity"),
+        ],
+    )
+    def test_weather_response_model(self, overrides, raises):
+        """Test WeatherResponse model validation for valid and invalid data."""
+        data = {**self._WEATHER_BASE, **overrides}
 
-        with pytest.raises(ValueError):
-            WeatherResponse(**invalid_data)
+        if raises:
+            with pytest.raises(ValueError):
+                WeatherResponse(**data)
+        else:
+            weather = WeatherResponse(**data)
+            assert weather.city == "seoul"
+            assert weather.temperature == 22.5
 
     def test_batch_weather_request_model(self):
         """Test BatchWeatherRequest model validation."""
@@ -509,17 +498,18 @@ class TestPydanticModels:
         request = BatchWeatherRequest(**valid_data)
         assert request.cities == ["seoul", "busan"]
 
-    def test_batch_weather_request_model_invalid(self):
+    @pytest.mark.parametrize(
+        "invalid_data",
+        [
+            pytest.param({"cities": "seoul"}, id="cities-not-list"),
+            pytest.param({"cities": [123]}, id="invalid-city-type"),
+            pytest.param({}, id="missing-cities"),
+        ],
+    )
+    def test_batch_weather_request_model_invalid(self, invalid_data):
         """Test BatchWeatherRequest model with invalid data."""
-        invalid_data_sets = [
-            {"cities": "seoul"},  # String instead of list
-            {"cities": [123]},  # Invalid city type
-            {},  # Missing cities
-        ]
-
-        for invalid_data in invalid_data_sets:
-            with pytest.raises(ValueError):
-                BatchWeatherRequest(**invalid_data)
+        with pytest.raises(ValueError):
+            BatchWeatherRequest(**invalid_data)
 
     def test_error_response_model(self):
         """Test ErrorResponse model validation."""
@@ -537,26 +527,26 @@ class TestPydanticModels:
 class TestErrorHandling:
     """Test cases for error handling and edge cases."""
 
-    def test_nonexistent_endpoint(self, client):
+    async def test_nonexistent_endpoint(self, client):
         """Test request to nonexistent endpoint."""
-        response = client.get("/nonexistent")
+        response = await client.get("/nonexistent")
         assert response.status_code == 404
 
-    def test_wrong_http_method(self, client):
+    async def test_wrong_http_method(self, client, test_api_key):
         """Test wrong HTTP method on endpoints."""
         # PUT to single weather endpoint (should be GET)
-        response = client.put(f"/weather/seoul?api_key={TEST_API_KEY}")
+        response = await client.put(f"/weather/seoul?api_key={test_api_key}")
         assert response.status_code == 405
 
         # DELETE to root endpoint (should be GET)
-        response = client.delete("/")
+        response = await client.delete("/")
         assert response.status_code == 405
 
-    def test_invalid_json_payload(self, client):
+    async def test_invalid_json_payload(self, client):
         """Test invalid JSON payload to batch endpoint."""
-        response = client.post(
+        response = await client.post(
             "/weather/batch",
-            data="invalid json",
+            content="invalid json",
             headers={"Content-Type": "application/json"},
         )
         assert response.status_code == 422
@@ -564,7 +554,7 @@ class TestErrorHandling:
     @pytest.mark.skip(
         reason="Logging verification requires mocking - not testable with real API"
     )
-    def test_logging_calls(self, client):
+    async def test_logging_calls(self, client):
         """Test that appropriate logging calls are made."""
         # This test requires mock verification for logging
         # Cannot be tested with real API integration
@@ -573,7 +563,7 @@ class TestErrorHandling:
     @pytest.mark.skip(
         reason="Unexpected errors require mocking - not testable with real API"
     )
-    def test_unexpected_error_handling(self, client):
+    async def test_unexpected_error_handling(self, client):
         """Test handling of unexpected errors."""
         # This test requires mocking unexpected exceptions
         # Cannot be tested with real API integration
@@ -583,33 +573,39 @@ class TestErrorHandling:
 class TestDocumentationEndpoints:
     """Test cases for API documentation endpoints."""
 
-    def test_swagger_docs_accessible(self, client):
-        """Test that Swagger docs are accessible."""
-        response = client.get("/docs")
+    # Read-only probes: safe to schedule on one xdist worker together
+    # (run with -n auto --dist=loadgroup)
+    pytestmark = pytest.mark.xdist_group("readonly")
+
+    async def test_swagger_docs_accessible(self, client):
+        """Test that Swagger docs are accessible.
+
+        Only the status and content type matter here, so a HEAD request
+        (registered alongside GET by Starlette) skips the HTML body.
+        """
+        response = await client.head("/docs")
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
-    def test_redoc_accessible(self, client):
+    async def test_redoc_accessible(self, client):
         """Test that ReDoc is disabled (returns 404)."""
-        response = client.get("/redoc")
+        response = await client.head("/redoc")
         assert response.status_code == 404
 
-    def test_openapi_schema_accessible(self, client):
+    def test_openapi_schema_accessible(self, openapi_response, openapi_schema):
         """Test that OpenAPI schema is accessible without API key."""
-        response = client.get("/dev/openapi.json")
-        assert response.status_code == 200
-        assert "application/json" in response.headers["content-type"]
+        assert openapi_response.status_code == 200
+        assert "application/json" in openapi_response.headers["content-type"]
 
-        schema = response.json()
+        schema = openapi_schema
         assert "openapi" in schema
         assert "info" in schema
         assert schema["info"]["title"] == "Weather API Service"
         assert schema["info"]["version"] == "1.0.0"
 
-    def test_openapi_schema_contains_security(self, client):
+    def test_openapi_schema_contains_security(self, openapi_schema):
         """Test that OpenAPI schema includes security schemes."""
-        response = client.get("/dev/openapi.json")
-        schema = response.json()
+        schema = openapi_schema
 
         # Check security schemes are defined
         assert "components" in schema
@@ -625,10 +621,9 @@ class TestDocumentationEndpoints:
         assert security_schemes["APIKeyHeader"]["type"] == "apiKey"
         assert security_schemes["APIKeyHeader"]["name"] == "X-API-Key"
 
-    def test_openapi_schema_contains_endpoints(self, client):
+    def test_openapi_schema_contains_endpoints(self, openapi_schema):
         """Test that OpenAPI schema includes all API endpoints."""
-        response = client.get("/dev/openapi.json")
-        schema = response.json()
+        schema = openapi_schema
 
         assert "paths" in schema
         paths = schema["paths"]
@@ -647,74 +642,72 @@ class TestDocumentationEndpoints:
 class TestCORSConfiguration:
     """Test cases for CORS configuration."""
 
-    def test_cors_middleware_configured(self, client):
-        """Test that CORS middleware is properly configured in the app."""
-        from lambda_function.lambda_function import app
+    pytestmark = pytest.mark.xdist_group("readonly")
 
+    async def test_cors_middleware_configured(self, client):
+        """Test that CORS middleware is properly configured in the app."""
         # Check if any middleware is configured (FastAPI automatically configures CORS)
         # In testing, CORS headers might not appear but middleware should be present
         assert len(app.user_middleware) > 0
 
-    def test_cors_preflight_request(self, client):
-        """Test CORS preflight request handling."""
-        headers = {
-            "Origin": "http://localhost:3000",
-            "Access-Control-Request-Method": "GET",
-            "Access-Control-Request-Headers": "Content-Type",
-        }
+    def test_cors_preflight_request(self):
+        """Test that CORS preflight handling is wired up.
 
-        response = client.options(
-            f"/weather/seoul?api_key={TEST_API_KEY}", headers=headers
+        The old OPTIONS round-trip only asserted status in [200, 405],
+        which passes regardless of configuration; inspecting the
+        middleware stack directly is both cheaper and stricter.
+        """
+        assert any(
+            middleware.cls is CORSMiddleware for middleware in app.user_middleware
         )
-        # OPTIONS request should be handled
-        assert response.status_code in [200, 405]  # 405 is also acceptable for OPTIONS
 
 
 # Integration test for the complete workflow
 class TestIntegrationWorkflow:
     """Integration tests for complete API workflow."""
 
-    @patch("weather_service.WeatherService")
-    def test_complete_api_workflow(self, mock_weather_service, client):
+    async def test_complete_api_workflow(
+        self, mock_weather_service, client, test_api_key
+    ):
         """Test complete workflow: root -> health -> single -> batch."""
-        # Mock the WeatherService
-        mock_service_instance = AsyncMock()
-        mock_service_instance.get_weather.return_value = MOCK_WEATHER_DATA
-        mock_service_instance.get_batch_weather.return_value = BatchWeatherResponse(
+        # Configure the shared WeatherService mock for all steps
+        mock_weather_service.get_weather.return_value = MOCK_WEATHER_DATA
+        mock_weather_service.get_batch_weather.return_value = BatchWeatherResponse(
             results=[MOCK_WEATHER_DATA, MOCK_WEATHER_DATA, MOCK_WEATHER_DATA],
             total_cities=3,
             successful_requests=3,
         )
-        mock_service_instance.health_check.return_value = {
+        mock_weather_service.health_check.return_value = {
             "status": "healthy",
             "timestamp": "2024-01-01T12:00:00Z",
             "external_api": "accessible",
         }
-        mock_weather_service.return_value = mock_service_instance
 
-        # Step 1: Check API info
-        root_response = client.get("/")
-        assert root_response.status_code == 200
+        # The four steps (root, health, single, batch) are independent,
+        # so dispatch them concurrently on the shared event loop
+        headers = {"X-API-Key": test_api_key}
+        batch_headers = {**headers, "Content-Type": "application/json"}
+        root_response, health_response, single_response, batch_response = (
+            await asyncio.gather(
+                client.get("/"),
+                client.get("/health", headers=headers),
+                client.get(f"/weather/seoul?api_key={test_api_key}"),
+                client.post(
+                    "/weather/batch",
+                    content=_BATCH_PAYLOAD_BYTES,
+                    headers=batch_headers,
+                ),
+            )
+        )
 
-        # Step 2: Check health with API key
-        headers = {"X-API-Key": TEST_API_KEY}
-        health_response = client.get("/health", headers=headers)
+        assert root_response.status_code == 200
         assert health_response.status_code == 200
-
-        # Step 3: Get single city weather
-        single_response = client.get(f"/weather/seoul?api_key={TEST_API_KEY}")
         assert single_response.status_code == 200
-
-        # Step 4: Get batch weather
-        batch_payload = {"cities": ["seoul", "busan", "tokyo"]}
-        batch_response = client.post(
-            "/weather/batch", json=batch_payload, headers=headers
-        )
         assert batch_response.status_code == 200
 
         # Verify all responses are consistent
-        single_data = single_response.json()
-        batch_data = batch_response.json()
+        single_data = jget(single_response)
+        batch_data = jget(batch_response)
 
         seoul_from_batch = next(
             result for result in batch_data["results"] if result["city"] == "Seoul"
@@ -13,12 +13,17 @@
 
 """
 
+import asyncio
 import os
 import time
 import logging
 from typing import Dict
+import aiohttp
+import orjson
 import requests
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 import pytest
 
@@ -31,6 +36,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# DynamoDB 배치 호출 제한 및 재시도 설정 (cache_service와 동일한 지수 백오프)
+BATCH_WRITE_MAX_ITEMS = 25
+BATCH_RETRY_MAX_ATTEMPTS = 3
+BATCH_RETRY_BASE_DELAY = 0.5
+
 
 class SimpleCacheTest:
     """간단한 캐시 성능 테스트"""
@@ -44,8 +54,8 @@ class SimpleCacheTest:
         self.aws_secret_access_key = os.getenv("AWS_SECRET_ACCESS_KEY")
         self.dynamodb_table_name = os.getenv("DYNAMODB_TABLE_NAME")
 
-        # 테스트 도시 목록
-        self.test_cities = [
+        # 테스트 도시 목록 (불변 튜플)
+        self.test_cities = (
             "Seoul",
             "Busan",
             "Incheon",
@@ -56,7 +66,20 @@ class SimpleCacheTest:
             "Suwon",
             "Changwon",
             "Goyang",
-        ]
+        )
+        self.num_cities = len(self.test_cities)
+
+        # 캐시 키 사전 계산 (도시명 정규화 반복 제거)
+        self.cache_keys = {
+            city: f"WEATHER#{city.strip().title()}" for city in self.test_cities
+        }
+
+        # 공통 요청 헤더/파라미터 (호출마다 dict 재생성 방지)
+        self._base_headers = {
+            "Content-Type": "application/json",
+            "X-API-Key": self.openweather_api_key,
+        }
+        self._base_params = {"api_key": self.openweather_api_key}
 
         # 결과 저장
         self.results = []
@@ -67,6 +90,9 @@ class SimpleCacheTest:
         # DynamoDB 초기화
         self._init_dynamodb()
 
+        # HTTP 세션 초기화
+        self._init_http()
+
     def _validate_config(self):
         """필수 설정 검증"""
         missing = []
@@ -92,44 +118,97 @@ class SimpleCacheTest:
     def _init_dynamodb(self):
         """DynamoDB 초기화"""
         try:
+            # 연결 풀 확장 + adaptive 재시도 + keepalive로 반복 호출 오버헤드 축소
+            config = Config(
+                max_pool_connections=32,
+                retries={"max_attempts": 3, "mode": "adaptive"},
+                tcp_keepalive=True,
+            )
             self.dynamodb = boto3.resource(
                 "dynamodb",
                 region_name=self.aws_region,
                 aws_access_key_id=self.aws_access_key_id,
                 aws_secret_access_key=self.aws_secret_access_key,
+                config=config,
             )
             self.table = self.dynamodb.Table(self.dynamodb_table_name)
+            self.ddb_client = self.dynamodb.meta.client
             logger.info("✅ DynamoDB 연결 성공")
         except Exception as e:
             raise RuntimeError(f"DynamoDB 연결 실패: {e}")
 
+    def _init_http(self):
+        """HTTP 세션 초기화 (연결 풀과 공통 헤더 재사용)"""
+        self.http = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32, pool_maxsize=32, max_retries=0
+        )
+        self.http.mount("https://", adapter)
+        self.http.mount("http://", adapter)
+        self.http.headers.update(self._base_headers)
+
     def clear_all_cache(self):
         """DynamoDB 전체 캐시 삭제"""
         logger.info("🗑️  DynamoDB 캐시 전체 삭제 중...")
 
         try:
-            # 모든 캐시 항목 조회
-            response = self.table.scan(
+            # 키만 페이지 단위로 조회 (아이템 본문 전송 생략)
+            paginator = self.ddb_client.get_paginator("scan")
+            keys = []
+            for page in paginator.paginate(
+                TableName=self.dynamodb_table_name,
                 FilterExpression="begins_with(PK, :pk_prefix)",
-                ExpressionAttributeValues={":pk_prefix": "WEATHER#"},
-            )
+                ExpressionAttributeValues={":pk_prefix": {"S": "WEATHER#"}},
+                ProjectionExpression="PK, SK",
+            ):
+                keys.extend(
+                    {"PK": item["PK"], "SK": item["SK"]}
+                    for item in page.get("Items", [])
+                )
 
-            # 배치 삭제
-            with self.table.batch_writer() as batch:
-                for item in response.get("Items", []):
-                    batch.delete_item(Key={"PK": item["PK"], "SK": item["SK"]})
+            self._delete_keys_batch(keys)
 
-            deleted_count = len(response.get("Items", []))
-            logger.info(f"✅ {deleted_count}개 캐시 항목 삭제 완료")
+            logger.info(f"✅ {len(keys)}개 캐시 항목 삭제 완료")
 
         except Exception as e:
             logger.error(f"❌ 캐시 삭제 실패: {e}")
             raise
 
+    def _delete_keys_batch(self, keys):
+        """키 목록을 25개 단위 BatchWriteItem으로 삭제
+
+        UnprocessedItems는 지수 백오프를 두고 제한 횟수까지만 재시도한다
+        (무한 재시도는 스로틀링 상태에서 핫스핀이 된다).
+        """
+        for i in range(0, len(keys), BATCH_WRITE_MAX_ITEMS):
+            request_items = {
+                self.dynamodb_table_name: [
+                    {"DeleteRequest": {"Key": key}}
+                    for key in keys[i : i + BATCH_WRITE_MAX_ITEMS]
+                ]
+            }
+            for attempt in range(1, BATCH_RETRY_MAX_ATTEMPTS + 1):
+                response = self.ddb_client.batch_write_item(RequestItems=request_items)
+                request_items = response.get("UnprocessedItems") or {}
+                if not request_items:
+                    break
+                if attempt < BATCH_RETRY_MAX_ATTEMPTS:
+                    time.sleep(BATCH_RETRY_BASE_DELAY * 2 ** (attempt - 1))
+
+            if request_items:
+                print(
+                    f"   ⚠️  {BATCH_RETRY_MAX_ATTEMPTS}회 시도 후에도 "
+                    "미처리 삭제 항목이 남았습니다"
+                )
+
+    def _cache_key(self, city: str) -> str:
+        """도시 캐시 키 반환 (테스트 도시는 사전 계산 값 재사용)"""
+        return self.cache_keys.get(city) or f"WEATHER#{city.strip().title()}"
+
     def check_cache_exists(self, city: str) -> bool:
         """특정 도시 캐시 존재 확인"""
         try:
-            cache_key = f"WEATHER#{city.strip().title()}"
+            cache_key = self._cache_key(city)
             response = self.table.get_item(Key={"PK": cache_key, "SK": "DATA"})
             exists = "Item" in response
             print(f"   DynamoDB 조회 결과: {'캐시 있음' if exists else '캐시 없음'}")
@@ -138,83 +217,162 @@ class SimpleCacheTest:
             print(f"   ❌ DynamoDB 조회 실패: {e}")
             return False
 
-    def call_weather_api(self, city: str) -> Dict:
-        """날씨 API 호출"""
-        url = f"{self.api_endpoint.rstrip('/')}/weather/{city}"
-
-        # API 키를 헤더 또는 쿼리 파라미터로 전달
-        headers = {
-            "Content-Type": "application/json",
-            "X-API-Key": self.openweather_api_key,
+    def check_cache_exists_batch(self, cities) -> set:
+        """여러 도시 캐시 존재 확인 (BatchGetItem으로 왕복 1회)"""
+        keys = [{"PK": self._cache_key(city), "SK": "DATA"} for city in cities]
+        present = set()
+        request_items = {
+            self.dynamodb_table_name: {
+                "Keys": keys,
+                "ProjectionExpression": "PK",
+            }
         }
 
-        params = {"api_key": self.openweather_api_key}
+        try:
+            # UnprocessedKeys는 지수 백오프를 두고 제한 횟수까지만 재요청
+            for attempt in range(1, BATCH_RETRY_MAX_ATTEMPTS + 1):
+                response = self.dynamodb.batch_get_item(RequestItems=request_items)
+                for item in response.get("Responses", {}).get(
+                    self.dynamodb_table_name, []
+                ):
+                    present.add(item["PK"])
+                request_items = response.get("UnprocessedKeys") or {}
+                if not request_items:
+                    break
+                if attempt < BATCH_RETRY_MAX_ATTEMPTS:
+                    time.sleep(BATCH_RETRY_BASE_DELAY * 2 ** (attempt - 1))
+
+            if request_items:
+                print(
+                    f"   ⚠️  {BATCH_RETRY_MAX_ATTEMPTS}회 시도 후에도 "
+                    "미처리 조회 키가 남았습니다"
+                )
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            if error_code == "ResourceNotFoundException":
+                print("   DynamoDB 조회 결과: 캐시 없음 (테이블 없음)")
+            elif error_code in (
+                "ThrottlingException",
+                "ProvisionedThroughputExceededException",
+            ):
+                print(f"   ⚠️  DynamoDB 스로틀링으로 배치 조회 중단: {e}")
+            else:
+                raise
+
+        return present
+
+    def _batch_delete(self, cities):
+        """여러 도시 캐시를 BatchWriteItem으로 한 번에 삭제"""
+        keys = [
+            {"PK": {"S": self._cache_key(city)}, "SK": {"S": "DATA"}} for city in cities
+        ]
 
-        start_time = time.time()
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
-            end_time = time.time()
+            self._delete_keys_batch(keys)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            if error_code == "ResourceNotFoundException":
+                print("   삭제할 캐시 없음 (테이블 없음)")
+            elif error_code in (
+                "ThrottlingException",
+                "ProvisionedThroughputExceededException",
+            ):
+                print(f"   ⚠️  DynamoDB 스로틀링으로 배치 삭제 중단: {e}")
+            else:
+                raise
 
-            response_time = end_time - start_time
+    def call_weather_api(self, city: str) -> Dict:
+        """날씨 API 호출"""
+        url = f"{self.api_endpoint.rstrip('/')}/weather/{city}"
+
+        # 벽시계 대신 단조 고해상도 타이머 사용
+        start_ns = time.perf_counter_ns()
+        try:
+            response = self.http.get(url, params=self._base_params, timeout=30)
+            response_time = (time.perf_counter_ns() - start_ns) / 1e9
 
             return {
                 "success": response.status_code == 200,
                 "status_code": response.status_code,
                 "response_time": response_time,
-                "data": response.json() if response.status_code == 200 else None,
+                "data": (
+                    orjson.loads(response.content)
+                    if response.status_code == 200
+                    else None
+                ),
                 "error": response.text if response.status_code != 200 else None,
             }
 
         except Exception as e:
-            end_time = time.time()
             return {
                 "success": False,
                 "status_code": None,
-                "response_time": end_time - start_time,
+                "response_time": (time.perf_counter_ns() - start_ns) / 1e9,
                 "data": None,
                 "error": str(e),
             }
 
-    def test_single_city_cache_performance(self, city: str) -> Dict:
-        """단일 도시 캐시 성능 테스트"""
-        print(f"\n{'='*60}")
-        print(f"🏙️  {city} 캐시 성능 테스트")
-        print(f"{'='*60}")
+    async def _call_weather_api_async(
+        self, session: aiohttp.ClientSession, city: str
+    ) -> Dict:
+        """날씨 API 비동기 호출 (공유 세션으로 연결 재사용)"""
+        url = f"{self.api_endpoint.rstrip('/')}/weather/{city}"
 
-        # 1. 해당 도시 캐시 삭제
-        cache_key = f"WEATHER#{city.strip().title()}"
+        # 벽시계 대신 단조 고해상도 타이머 사용
+        start_ns = time.perf_counter_ns()
         try:
-            self.table.delete_item(Key={"PK": cache_key, "SK": "DATA"})
-            print(f"✅ {city} 캐시 삭제 완료")
-        except:
-            print(f"ℹ️  {city} 캐시 없음 (정상)")
+            async with session.get(
+                url,
+                params=self._base_params,
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as response:
+                body = await response.read()
+                data = orjson.loads(body) if response.status == 200 else None
+                error = await response.text() if response.status != 200 else None
+                response_time = (time.perf_counter_ns() - start_ns) / 1e9
+
+                return {
+                    "success": response.status == 200,
+                    "status_code": response.status,
+                    "response_time": response_time,
+                    "data": data,
+                    "error": error,
+                }
 
-        # 2. 첫 번째 조회 (캐시 미스)
-        print(f"\n📞 {city} 첫 번째 호출 (캐시 미스 예상)...")
-        first_call = self.call_weather_api(city)
+        except Exception as e:
+            return {
+                "success": False,
+                "status_code": None,
+                "response_time": (time.perf_counter_ns() - start_ns) / 1e9,
+                "data": None,
+                "error": str(e),
+            }
+
+    async def _test_single_city_cache_async(
+        self, session: aiohttp.ClientSession, city: str
+    ) -> Dict:
+        """단일 도시 캐시 성능 비동기 테스트 (미스 → 확인 → 히트)
+
+        캐시 삭제는 _run_all_cities_async에서 배치로 선행 처리한다.
+        """
+        loop = asyncio.get_running_loop()
 
+        # 1. 첫 번째 조회 (캐시 미스)
+        first_call = await self._call_weather_api_async(session, city)
         if not first_call["success"]:
             print(f"❌ {city} 첫 번째 호출 실패: {first_call['error']}")
             return {"city": city, "success": False, "error": first_call["error"]}
 
-        print(f"⏱️  첫 번째 호출 응답 시간: {first_call['response_time']:.3f}초")
-
-        # 3. DynamoDB 캐시 생성 확인
-        print(f"\n🔍 DynamoDB 캐시 확인 중...")
-        cache_created = self.check_cache_exists(city)
-        print(f"✅ 캐시 생성 확인: {'성공' if cache_created else '실패'}")
-
-        # 4. 두 번째 조회 (캐시 히트)
-        print(f"\n📞 {city} 두 번째 호출 (캐시 히트 예상)...")
-        second_call = self.call_weather_api(city)
+        # 2. DynamoDB 캐시 생성 확인
+        cache_created = await loop.run_in_executor(None, self.check_cache_exists, city)
 
+        # 3. 두 번째 조회 (캐시 히트)
+        second_call = await self._call_weather_api_async(session, city)
         if not second_call["success"]:
             print(f"❌ {city} 두 번째 호출 실패: {second_call['error']}")
             return {"city": city, "success": False, "error": second_call["error"]}
 
-        print(f"⏱️  두 번째 호출 응답 시간: {second_call['response_time']:.3f}초")
-
-        # 5. 결과 분석
+        # 4. 결과 분석
         cache_miss_time = first_call["response_time"]
         cache_hit_time = second_call["response_time"]
         speed_improvement = (
@@ -222,15 +380,12 @@ class SimpleCacheTest:
         )
         time_saved = cache_miss_time - cache_hit_time
 
-        print(f"\n⚡ {city} 성능 비교:")
-        print(f"   캐시 미스 (외부 API): {cache_miss_time:.3f}초")
-        print(f"   캐시 히트 (DynamoDB): {cache_hit_time:.3f}초")
-        print(f"   성능 향상: {speed_improvement:.2f}배 빠름")
         print(
-            f"   시간 절약: {time_saved:.3f}초 ({((time_saved / cache_miss_time) * 100):.1f}%)"
+            f"⚡ {city}: 캐시 미스 {cache_miss_time:.3f}초 → "
+            f"캐시 히트 {cache_hit_time:.3f}초 ({speed_improvement:.2f}배 빠름)"
         )
 
-        result = {
+        return {
             "city": city,
             "success": True,
             "cache_created": cache_created,
@@ -243,7 +398,21 @@ class SimpleCacheTest:
             ),
         }
 
-        return result
+    async def _run_all_cities_async(self) -> list:
+        """전체 도시 테스트를 하나의 세션에서 동시 실행"""
+        # 도시별 개별 삭제 대신 배치 삭제로 선행 처리
+        self._batch_delete(self.test_cities)
+
+        connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(
+            connector=connector, headers=self._base_headers
+        ) as session:
+            return await asyncio.gather(
+                *[
+                    self._test_single_city_cache_async(session, city)
+                    for city in self.test_cities
+                ]
+            )
 
     def test_batch_cache_performance(self) -> Dict:
         """배치 캐시 성능 테스트"""
@@ -255,14 +424,9 @@ class SimpleCacheTest:
         batch_cities = self.test_cities
         print(f"📋 배치 테스트 도시: {', '.join(batch_cities)}")
 
-        # 1. 배치 도시들 캐시 삭제
+        # 1. 배치 도시들 캐시 삭제 (BatchWriteItem으로 왕복 1회)
         print(f"\n🗑️  배치 도시들 캐시 삭제 중...")
-        for city in batch_cities:
-            cache_key = f"WEATHER#{city.strip().title()}"
-            try:
-                self.table.delete_item(Key={"PK": cache_key, "SK": "DATA"})
-            except:
-                pass
+        self._batch_delete(batch_cities)
 
         # 2. 첫 번째 배치 호출 (캐시 미스)
         print(f"\n📞 첫 번째 배치 호출 (캐시 미스 예상)...")
@@ -277,10 +441,7 @@ class SimpleCacheTest:
 
         # 3. DynamoDB 캐시 생성 확인
         print(f"\n🔍 배치 도시들 캐시 확인 중...")
-        cached_count = 0
-        for city in batch_cities:
-            if self.check_cache_exists(city):
-                cached_count += 1
+        cached_count = len(self.check_cache_exists_batch(batch_cities))
 
         print(f"✅ 캐시 생성 확인: {cached_count}/{len(batch_cities)}개 도시 캐시됨")
 
@@ -324,32 +485,29 @@ class SimpleCacheTest:
         """배치 날씨 API 호출"""
         url = f"{self.api_endpoint.rstrip('/')}/weather/batch"
 
-        headers = {
-            "Content-Type": "application/json",
-            "X-API-Key": self.openweather_api_key,
-        }
-
-        start_time = time.time()
+        # 벽시계 대신 단조 고해상도 타이머 사용
+        start_ns = time.perf_counter_ns()
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
-            end_time = time.time()
-
-            response_time = end_time - start_time
+            response = self.http.post(url, json=payload, timeout=30)
+            response_time = (time.perf_counter_ns() - start_ns) / 1e9
 
             return {
                 "success": response.status_code == 200,
                 "status_code": response.status_code,
                 "response_time": response_time,
-                "data": response.json() if response.status_code == 200 else None,
+                "data": (
+                    orjson.loads(response.content)
+                    if response.status_code == 200
+                    else None
+                ),
                 "error": response.text if response.status_code != 200 else None,
             }
 
         except Exception as e:
-            end_time = time.time()
             return {
                 "success": False,
                 "status_code": None,
-                "response_time": end_time - start_time,
+                "response_time": (time.perf_counter_ns() - start_ns) / 1e9,
                 "data": None,
                 "error": str(e),
             }
@@ -360,9 +518,7 @@ class SimpleCacheTest:
         print("🚀 배포된 Weather API 배치 서비스 캐시 성능 테스트")
         print("=" * 80)
         print(f"🔄 반복 횟수: {iterations}회")
-        print(
-            f"📋 배치 도시: {', '.join(self.test_cities)} (총 {len(self.test_cities)}개)"
-        )
+        print(f"📋 배치 도시: {', '.join(self.test_cities)} (총 {self.num_cities}개)")
         print(f"🔧 API 엔드포인트: {self.api_endpoint}")
         print(f"🗄️  DynamoDB 테이블: {self.dynamodb_table_name}")
 
@@ -426,19 +582,19 @@ class SimpleCacheTest:
 
             print("─" * 80)
 
-            # 평균 계산
-            avg_cache_miss = sum(r["cache_miss_time"] for r in successful_tests) / len(
-                successful_tests
-            )
-            avg_cache_hit = sum(r["cache_hit_time"] for r in successful_tests) / len(
-                successful_tests
-            )
-            avg_improvement = sum(
-                r["speed_improvement"] for r in successful_tests
-            ) / len(successful_tests)
-            avg_time_saved = sum(r["time_saved"] for r in successful_tests) / len(
-                successful_tests
-            )
+            # 평균 계산 (결과 리스트 1회 순회로 4개 합계 누적)
+            total_miss = total_hit = total_improvement = total_saved = 0.0
+            for r in successful_tests:
+                total_miss += r["cache_miss_time"]
+                total_hit += r["cache_hit_time"]
+                total_improvement += r["speed_improvement"]
+                total_saved += r["time_saved"]
+
+            count = len(successful_tests)
+            avg_cache_miss = total_miss / count
+            avg_cache_hit = total_hit / count
+            avg_improvement = total_improvement / count
+            avg_time_saved = total_saved / count
 
             # 평균 행
             avg_miss_str = f"{avg_cache_miss:.3f}초"
@@ -492,11 +648,9 @@ class SimpleCacheTest:
         print(f"\n🗑️  초기 캐시 전체 삭제 중...")
         self.clear_all_cache()
 
-        # 각 도시별 테스트
-        for i, city in enumerate(self.test_cities, 1):
-            print(f"\n📍 테스트 진행: {i}/{len(self.test_cities)}")
-            result = self.test_single_city_cache_performance(city)
-            self.results.append(result)
+        # 각 도시별 테스트를 동시 실행 (RTT 중첩으로 벽시계 시간 단축)
+        print(f"\n📍 {self.num_cities}개 도시 동시 테스트 실행 중...")
+        self.results = list(asyncio.run(self._run_all_cities_async()))
 
         # 최종 결과 출력
         self._print_final_results()
@@ -546,19 +700,19 @@ class SimpleCacheTest:
 
             print("─" * 90)
 
-            # 평균 계산
-            avg_cache_miss = sum(r["cache_miss_time"] for r in successful_tests) / len(
-                successful_tests
-            )
-            avg_cache_hit = sum(r["cache_hit_time"] for r in successful_tests) / len(
-                successful_tests
-            )
-            avg_improvement = sum(
-                r["speed_improvement"] for r in successful_tests
-            ) / len(successful_tests)
-            avg_time_saved = sum(r["time_saved"] for r in successful_tests) / len(
-                successful_tests
-            )
+            # 평균 계산 (결과 리스트 1회 순회로 4개 합계 누적)
+            total_miss = total_hit = total_improvement = total_saved = 0.0
+            for r in successful_tests:
+                total_miss += r["cache_miss_time"]
+                total_hit += r["cache_hit_time"]
+                total_improvement += r["speed_improvement"]
+                total_saved += r["time_saved"]
+
+            count = len(successful_tests)
+            avg_cache_miss = total_miss / count
+            avg_cache_hit = total_hit / count
+            avg_improvement = total_improvement / count
+            avg_time_saved = total_saved / count
 
             # 평균 행
             avg_miss_str = f"{avg_cache_miss:.3f}초"